@@ -8,11 +8,9 @@ from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from http.cookies import SimpleCookie
 from queue import Queue
-from typing import IO
+from typing import IO, TYPE_CHECKING
 from urllib.parse import parse_qsl, urlparse
 
-import harfile
-
 from schemathesis.cli.commands.run.context import ExecutionContext
 from schemathesis.cli.commands.run.handlers.base import EventHandler, TextOutput, open_text_output
 from schemathesis.config import ProjectConfig, ReportFormat, SchemathesisConfig
@@ -24,6 +22,9 @@ from schemathesis.engine import Status, events
 from schemathesis.engine.recorder import CheckNode, Request, ScenarioRecorder
 from schemathesis.generation.meta import CoveragePhaseData
 
+if TYPE_CHECKING:
+    import harfile
+
 # Wait until the worker terminates
 WRITER_WORKER_JOIN_TIMEOUT = 1
 
@@ -341,22 +342,33 @@ def write_double_quoted(stream: IO, text: str | None) -> None:
 
 
 def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) -> None:
+    import harfile
+
+    no_response = harfile.Response(
+        status=0,
+        httpVersion="",
+        statusText="",
+        headers=[],
+        cookies=[],
+        content=harfile.Content(),
+    )
+    sanitization = config.output.sanitization
+    preserve_bytes = config.reports.preserve_bytes
     with harfile.open(output) as har:
         while True:
             item = queue.get()
             if isinstance(item, Process):
                 for interaction in item.recorder.interactions.values():
-                    if config.output.sanitization.enabled:
-                        uri = sanitize_url(interaction.request.uri, config=config.output.sanitization)
+                    request = interaction.request
+                    if sanitization.enabled:
+                        uri = sanitize_url(request.uri, config=sanitization)
                     else:
-                        uri = interaction.request.uri
+                        uri = request.uri
                     query_params = urlparse(uri).query
-                    if interaction.request.body is not None:
+                    if request.body is not None:
                         post_data = harfile.PostData(
-                            mimeType=interaction.request.headers.get("Content-Type", [""])[0],
-                            text=interaction.request.encoded_body
-                            if config.reports.preserve_bytes
-                            else interaction.request.body.decode("utf-8", "replace"),
+                            mimeType=request.headers.get("Content-Type", [""])[0],
+                            text=request.encoded_body if preserve_bytes else request.body.decode("utf-8", "replace"),
                         )
                     else:
                         post_data = None
@@ -366,18 +378,16 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                             size=interaction.response.body_size or 0,
                             mimeType=content_type,
                             text=interaction.response.encoded_body
-                            if config.reports.preserve_bytes
+                            if preserve_bytes
                             else interaction.response.content.decode("utf-8", "replace")
                             if interaction.response.content is not None
                             else None,
-                            encoding="base64"
-                            if interaction.response.content is not None and config.reports.preserve_bytes
-                            else None,
+                            encoding="base64" if interaction.response.content is not None and preserve_bytes else None,
                         )
                         http_version = f"HTTP/{interaction.response.http_version}"
-                        if config.output.sanitization.enabled:
+                        if sanitization.enabled:
                             headers = deepclone(interaction.response.headers)
-                            sanitize_value(headers, config=config.output.sanitization)
+                            sanitize_value(headers, config=sanitization)
                         else:
                             headers = interaction.response.headers
                         response = harfile.Response(
@@ -393,15 +403,15 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                         )
                         time = round(interaction.response.elapsed * 1000, 2)
                     else:
-                        response = HARFILE_NO_RESPONSE
+                        response = no_response
                         time = 0
                         http_version = ""
 
-                    if config.output.sanitization.enabled:
-                        headers = deepclone(interaction.request.headers)
-                        sanitize_value(headers, config=config.output.sanitization)
+                    if sanitization.enabled:
+                        headers = deepclone(request.headers)
+                        sanitize_value(headers, config=sanitization)
                     else:
-                        headers = interaction.request.headers
+                        headers = request.headers
                     started_datetime = datetime.datetime.fromtimestamp(
                         interaction.timestamp, datetime.timezone.utc
                     ).isoformat()
@@ -409,7 +419,7 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                         startedDateTime=started_datetime,
                         time=time,
                         request=harfile.Request(
-                            method=interaction.request.method.upper(),
+                            method=request.method.upper(),
                             url=uri,
                             httpVersion=http_version,
                             headers=[harfile.Record(name=name, value=values[0]) for name, values in headers.items()],
@@ -419,7 +429,7 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                             ],
                             cookies=_extract_cookies(headers.get("Cookie", [])),
                             headersSize=_headers_size(headers),
-                            bodySize=interaction.request.body_size or 0,
+                            bodySize=request.body_size or 0,
                             postData=post_data,
                         ),
                         response=response,
@@ -429,16 +439,6 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                 break
 
 
-HARFILE_NO_RESPONSE = harfile.Response(
-    status=0,
-    httpVersion="",
-    statusText="",
-    headers=[],
-    cookies=[],
-    content=harfile.Content(),
-)
-
-
 def _headers_size(headers: dict[str, list[str]]) -> int:
     size = 0
     for name, values in headers.items():
@@ -452,6 +452,8 @@ def _extract_cookies(headers: list[str]) -> list[harfile.Cookie]:
 
 
 def _cookie_to_har(cookie: str) -> Iterator[harfile.Cookie]:
+    import harfile
+
     parsed = SimpleCookie(cookie)
     for name, data in parsed.items():
         yield harfile.Cookie(
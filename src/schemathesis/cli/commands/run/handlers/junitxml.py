@@ -3,14 +3,16 @@ from __future__ import annotations
 import platform
 from collections.abc import Iterable
 from dataclasses import dataclass
-
-from junit_xml import TestCase, TestSuite, to_xml_report_file
+from typing import TYPE_CHECKING
 
 from schemathesis.cli.commands.run.context import ExecutionContext, GroupedFailures
 from schemathesis.cli.commands.run.handlers.base import EventHandler, TextOutput, open_text_output
 from schemathesis.core.failures import format_failures
 from schemathesis.engine import Status, events
 
+if TYPE_CHECKING:
+    from junit_xml import TestCase
+
 
 @dataclass
 class JunitXMLHandler(EventHandler):
@@ -36,6 +38,8 @@ class JunitXMLHandler(EventHandler):
             test_case = self.get_or_create_test_case(event.label)
             test_case.add_error_info(output=event.info.format())
         elif isinstance(event, events.EngineFinished):
+            from junit_xml import TestSuite, to_xml_report_file
+
             test_suites = [
                 TestSuite("schemathesis", test_cases=list(self.test_cases.values()), hostname=platform.node())
             ]
@@ -43,7 +47,13 @@ class JunitXMLHandler(EventHandler):
                 to_xml_report_file(file_descriptor=fd, test_suites=test_suites, prettyprint=True, encoding="utf-8")
 
     def get_or_create_test_case(self, label: str) -> TestCase:
-        return self.test_cases.setdefault(label, TestCase(label, elapsed_sec=0.0, allow_multiple_subelements=True))
+        test_case = self.test_cases.get(label)
+        if test_case is None:
+            from junit_xml import TestCase
+
+            test_case = TestCase(label, elapsed_sec=0.0, allow_multiple_subelements=True)
+            self.test_cases[label] = test_case
+        return test_case
 
 
 def add_failure(test_case: TestCase, checks: Iterable[GroupedFailures], context: ExecutionContext) -> None:
@@ -843,7 +843,7 @@ class OutputHandler(EventHandler):
             self._on_scenario_finished(ctx, event)
         elif isinstance(event, events.SchemaAnalysisWarnings):
             self._on_schema_warnings(ctx, event)
-        if isinstance(event, events.EngineFinished):
+        elif isinstance(event, events.EngineFinished):
             self._on_engine_finished(ctx, event)
         elif isinstance(event, events.Interrupted):
             self._on_interrupted(event)
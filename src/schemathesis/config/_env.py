@@ -13,6 +13,9 @@ def resolve(value: Any) -> Any:
         return None
     if not isinstance(value, str):
         return value
+    if "$" not in value:
+        # No placeholders, no need to build a template
+        return value
     try:
         return Template(value).substitute(os.environ)
     except ValueError:
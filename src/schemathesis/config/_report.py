@@ -22,11 +22,14 @@ class ReportFormat(str, Enum):
     @property
     def extension(self) -> str:
         """File extension for this format."""
-        return {
-            self.JUNIT: "xml",
-            self.VCR: "yaml",
-            self.HAR: "json",
-        }[self]
+        return REPORT_EXTENSIONS[self]
+
+
+REPORT_EXTENSIONS = {
+    ReportFormat.JUNIT: "xml",
+    ReportFormat.VCR: "yaml",
+    ReportFormat.HAR: "json",
+}
 
 
 @dataclass(repr=False)
@@ -56,7 +59,7 @@ class ReportsConfig(DiffBase):
     junit: ReportConfig
     vcr: ReportConfig
     har: ReportConfig
-    _timestamp: str
+    _timestamp: str | None
 
     __slots__ = ("directory", "preserve_bytes", "junit", "vcr", "har", "_timestamp")
 
@@ -74,7 +77,8 @@ class ReportsConfig(DiffBase):
         self.junit = junit or ReportConfig()
         self.vcr = vcr or ReportConfig()
         self.har = har or ReportConfig()
-        self._timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
+        # Computed on first use, most runs don't write any reports
+        self._timestamp = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ReportsConfig:
@@ -113,8 +117,17 @@ class ReportsConfig(DiffBase):
 
     def get_path(self, format: ReportFormat) -> Path:
         """Get the final path for a specific format."""
-        report: ReportConfig = getattr(self, format.value)
+        if format is ReportFormat.JUNIT:
+            report = self.junit
+        elif format is ReportFormat.VCR:
+            report = self.vcr
+        elif format is ReportFormat.HAR:
+            report = self.har
+        else:
+            raise ValueError(f"Unknown report format: {format}")  # pragma: no cover
         if report.path is not None:
             return report.path
 
+        if self._timestamp is None:
+            self._timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
         return self.directory / f"{format.value}-{self._timestamp}.{format.extension}"
@@ -16,8 +16,7 @@ def sanitize_value(item: Any, *, config: SanitizationConfig) -> None:
     """
     if isinstance(item, MutableMapping):
         for key in list(item.keys()):
-            lower_key = key.lower()
-            if lower_key in config.keys_to_sanitize or any(marker in lower_key for marker in config.sensitive_markers):
+            if _is_sensitive_key(key, config.keys_to_sanitize, config.sensitive_markers):
                 if isinstance(item[key], list):
                     item[key] = [config.replacement]
                 else:
@@ -31,6 +30,13 @@ def sanitize_value(item: Any, *, config: SanitizationConfig) -> None:
                 sanitize_value(value, config=config)
 
 
+@lru_cache(maxsize=512)
+def _is_sensitive_key(key: str, keys_to_sanitize: tuple[str, ...], sensitive_markers: tuple[str, ...]) -> bool:
+    # The same header & parameter names show up in almost every interaction
+    lower_key = key.lower()
+    return lower_key in keys_to_sanitize or any(marker in lower_key for marker in sensitive_markers)
+
+
 def sanitize_url(url: str, *, config: SanitizationConfig) -> str:
     """Sanitize sensitive parts of a given URL.
 
@@ -28,6 +28,8 @@ class EngineEvent:
     # Indicates whether this event is the last in the event stream
     is_terminal = False
 
+    __slots__ = ()
+
 
 @dataclass
 class EngineStarted(EngineEvent):
@@ -46,6 +48,8 @@ class PhaseEvent(EngineEvent):
 
     phase: Phase
 
+    __slots__ = ()
+
 
 @dataclass
 class StatefulPhasePayload:
@@ -105,6 +109,8 @@ class SchemaAnalysisWarnings(PhaseEvent):
 class TestEvent(EngineEvent):
     phase: PhaseName
 
+    __slots__ = ()
+
 
 @dataclass
 class SuiteStarted(TestEvent):
@@ -137,6 +143,8 @@ class SuiteFinished(TestEvent):
 class ScenarioEvent(TestEvent):
     suite_id: uuid.UUID
 
+    __slots__ = ()
+
 
 @dataclass
 class ScenarioStarted(ScenarioEvent):
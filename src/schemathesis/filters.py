@@ -51,7 +51,7 @@ class Matcher:
     def for_value(cls, attribute: str, expected: FilterValue) -> Matcher:
         """Matcher that checks whether the specified attribute has the expected value."""
         if isinstance(expected, list):
-            func = partial(by_value_list, attribute=attribute, expected=expected)
+            func = partial(by_value_list, attribute=attribute, expected=frozenset(expected))
         else:
             func = partial(by_value, attribute=attribute, expected=expected)
         label = f"{attribute}={expected!r}"
@@ -97,13 +97,14 @@ def by_value(ctx: HasAPIOperation, attribute: str, expected: str) -> bool:
     return value == expected
 
 
-def by_value_list(ctx: HasAPIOperation, attribute: str, expected: list[str]) -> bool:
+def by_value_list(ctx: HasAPIOperation, attribute: str, expected: frozenset[str]) -> bool:
     value = get_operation_attribute(ctx.operation, attribute)
     if value is None:
         return False
+    # Raw schema values may be unhashable in malformed schemas; those never match
     if isinstance(value, list):
-        return any(entry in expected for entry in value)
-    return value in expected
+        return any(isinstance(entry, str) and entry in expected for entry in value)
+    return isinstance(value, str) and value in expected
 
 
 def by_regex(ctx: HasAPIOperation, attribute: str, regex: re.Pattern) -> bool:
@@ -441,9 +441,11 @@ class OpenApiResponseHeader:
     scope: str
     adapter: SpecificationAdapter
 
-    __slots__ = ("name", "definition", "resolver", "scope", "adapter", "_bundle", "_validator")
+    __slots__ = ("name", "definition", "resolver", "scope", "adapter", "lowercase_name", "_bundle", "_validator")
 
     def __post_init__(self) -> None:
+        # Response headers are stored with lowercase keys, normalize once instead of on every check
+        self.lowercase_name = self.name.lower()
         self._bundle: Bundle | NotSet = NOT_SET
         self._validator: Validator | NotSet = NOT_SET
 
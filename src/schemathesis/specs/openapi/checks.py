@@ -187,7 +187,7 @@ def response_headers_conformance(ctx: CheckContext, response: Response, case: Ca
     missing_headers = []
 
     for name, header in headers.items():
-        values = response.headers.get(name.lower())
+        values = response.headers.get(header.lowercase_name)
         if values is not None:
             value = values[0]
             coerced = _coerce_header_value(value, header.schema)
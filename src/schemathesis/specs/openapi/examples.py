@@ -58,11 +58,12 @@ class BodyExample:
 Example = ParameterExample | BodyExample
 
 
-def merge_kwargs(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
-    mergeable_keys = {"path_parameters", "headers", "cookies", "query"}
+MERGEABLE_KWARGS = frozenset(("path_parameters", "headers", "cookies", "query"))
+
 
+def merge_kwargs(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
     for key, value in right.items():
-        if key in mergeable_keys and key in left:
+        if key in MERGEABLE_KWARGS and key in left:
             if isinstance(left[key], dict) and isinstance(value, dict):
                 # kwargs takes precedence
                 left[key] = {**left[key], **value}
@@ -403,6 +403,8 @@ def find_producer_consumer_candidates(operations: OperationMap) -> list[tuple[st
 
 def _extract_base_path(path: str) -> str:
     """Extract collection path: /blog/posts/{id} -> /blog/posts."""
+    if "{" not in path:
+        return path.rstrip("/")
     parts = [p for p in path.split("/") if not p.startswith("{")]
     return "/".join(parts).rstrip("/")
 
@@ -422,8 +424,8 @@ def _is_collection_item_pattern(collection_path: str, item_path: str) -> bool:
 
     # Must be a single path parameter: {paramName} with no slashes
     return (
-        remainder.startswith("{")
-        and remainder.endswith("}")
-        and len(remainder) > 2  # Not empty {}
+        len(remainder) > 2  # Not empty {}
+        and remainder[0] == "{"
+        and remainder[-1] == "}"
         and "/" not in remainder
     )
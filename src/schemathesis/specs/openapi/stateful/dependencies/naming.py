@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+CAPITAL_ID_SUFFIXES = ("Id", "Uuid", "Guid")
+SNAKE_ID_SUFFIXES = ("_guid", "_uuid", "_id", "-guid", "-uuid", "-id")
+
 
 def from_parameter(parameter: str, path: str) -> str | None:
     parameter = parameter.strip()
@@ -9,20 +14,20 @@ def from_parameter(parameter: str, path: str) -> str | None:
         return from_path(path, parameter_name=parameter)
 
     # Capital-sensitive
-    capital_suffixes = ("Id", "Uuid", "Guid")
-    for suffix in capital_suffixes:
-        if parameter.endswith(suffix):
-            prefix = parameter[: -len(suffix)]
-            if len(prefix) >= 2:
-                return to_pascal_case(prefix)
+    if parameter.endswith(CAPITAL_ID_SUFFIXES):
+        for suffix in CAPITAL_ID_SUFFIXES:
+            if parameter.endswith(suffix):
+                prefix = parameter[: -len(suffix)]
+                if len(prefix) >= 2:
+                    return to_pascal_case(prefix)
 
     # Snake_case (case-insensitive is fine here)
-    snake_suffixes = ("_guid", "_uuid", "_id", "-guid", "-uuid", "-id")
-    for suffix in snake_suffixes:
-        if lower.endswith(suffix):
-            prefix = parameter[: -len(suffix)]
-            if len(prefix) >= 2:
-                return to_pascal_case(prefix)
+    if lower.endswith(SNAKE_ID_SUFFIXES):
+        for suffix in SNAKE_ID_SUFFIXES:
+            if lower.endswith(suffix):
+                prefix = parameter[: -len(suffix)]
+                if len(prefix) >= 2:
+                    return to_pascal_case(prefix)
 
     # Special cases that need exact match
     # Twilio-style, capital S
@@ -56,10 +61,10 @@ def from_path(path: str, parameter_name: str | None = None) -> str | None:
             pass  # Parameter not found in path
 
     # Fallback to last non-parameter segment
-    non_param_segments = [s for s in segments if "{" not in s]
-    if non_param_segments:
-        singular = to_singular(non_param_segments[-1])
-        return to_pascal_case(singular)
+    for segment in reversed(segments):
+        if "{" not in segment:
+            singular = to_singular(segment)
+            return to_pascal_case(singular)
 
     return None
 
@@ -289,15 +294,13 @@ UNCOUNTABLE = frozenset(
 def _is_word_like(s: str) -> bool:
     """Check if string looks like a word (not a path, technical term, etc)."""
     # Skip empty or very short
-    if not s or len(s) < 2:
-        return False
-    # Skip if contains non-word characters (except underscore and hyphen)
-    if not all(c.isalpha() or c in ("_", "-") for c in s):
+    if len(s) < 2:
         return False
-    # Skip if has numbers
-    return not any(c.isdigit() for c in s)
+    # Skip if contains non-word characters (except underscore and hyphen), including digits
+    return all(c.isalpha() or c in ("_", "-") for c in s)
 
 
+@lru_cache(maxsize=1024)
 def to_singular(word: str) -> str:
     if not _is_word_like(word):
         return word
@@ -374,6 +377,10 @@ def to_snake_case(text: str) -> str:
     return "".join(result)
 
 
+# Common identifier field names in priority order
+ID_FIELD_NAMES = ("id", "uuid", "guid", "uid")
+
+
 def find_matching_field(*, parameter: str, resource: str, fields: list[str]) -> str | None:
     """Find which resource field matches the parameter name."""
     if not fields:
@@ -422,14 +429,12 @@ def find_matching_field(*, parameter: str, resource: str, fields: list[str]) ->
     parameter_prefix, parameter_suffix = _split_parameter_name(parameter)
     suffix_normalized = _normalize_for_matching(parameter_suffix)
 
-    # Common identifier field names in priority order (id, uuid, guid, uid)
-    ID_FIELD_NAMES = ["id", "uuid", "guid", "uid"]
-
     if suffix_normalized in ID_FIELD_NAMES:
         # Try to match with any identifier field, preferring exact match first
+        fields_normalized = [_normalize_for_matching(field) for field in fields]
         for id_name in ID_FIELD_NAMES:
-            for field in fields:
-                if _normalize_for_matching(field) == id_name:
+            for field, field_normalized in zip(fields, fields_normalized, strict=True):
+                if field_normalized == id_name:
                     return field
 
     return None
@@ -29,6 +29,8 @@ if TYPE_CHECKING:
     from schemathesis.engine.observations import LocationHeaderEntry
     from schemathesis.specs.openapi.schemas import OpenApiSchema
 
+PATH_PARAMETER_RE = re.compile(r"\{([^}]+)\}")
+
 
 @dataclass(unsafe_hash=True)
 class OperationById:
@@ -104,7 +106,7 @@ class LinkInferencer:
             operations.append(operation)
 
             # Replace `{parameter}` with `<parameter>` as angle brackets are used for parameters in werkzeug
-            path = re.sub(r"\{([^}]+)\}", r"<\1>", path)
+            path = PATH_PARAMETER_RE.sub(r"<\1>", path)
             rules.append(Rule(path, endpoint=operation, methods=[method.upper()]))
 
         return cls(
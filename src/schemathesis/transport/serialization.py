@@ -318,6 +318,9 @@ def _escape_xml(value: JSON) -> str:
     return "".join(replacements.get(c, c) for c in cleaned)
 
 
+INVALID_XML_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_\-.]")
+
+
 def _sanitize_xml_name(name: str) -> str:
     """Sanitize a string to be a valid XML element name."""
     if not name:
@@ -326,7 +329,7 @@ def _sanitize_xml_name(name: str) -> str:
     name = normalize("NFKC", str(name))
 
     name = name.replace(":", "_")
-    sanitized = re.sub(r"[^a-zA-Z0-9_\-.]", "_", name)
+    sanitized = INVALID_XML_NAME_CHARS_RE.sub("_", name)
 
     if not sanitized[0].isalpha() and sanitized[0] != "_":
         sanitized = "x_" + sanitized
@@ -5,6 +5,7 @@ import pytest
 from schemathesis.config import ConfigError, SchemathesisConfig
 from schemathesis.config._operations import OperationConfig
 from schemathesis.config._projects import ProjectConfig
+from schemathesis.config._report import ReportFormat, ReportsConfig
 from schemathesis.config._validator import CONFIG_SCHEMA
 from schemathesis.core.errors import HookError
 
@@ -107,3 +108,17 @@ def test_project_config_path_delegates_to_parent(tmp_path):
 def test_project_config_path_none_without_parent():
     project_config = ProjectConfig()
     assert project_config.config_path is None
+
+
+def test_report_timestamp_is_shared_across_formats():
+    reports = ReportsConfig()
+    # Not computed until a report path is needed
+    assert reports._timestamp is None
+    paths = [reports.get_path(format) for format in ReportFormat]
+    timestamp = reports._timestamp
+    assert timestamp is not None
+    assert [path.name for path in paths] == [
+        f"junit-{timestamp}.xml",
+        f"vcr-{timestamp}.yaml",
+        f"har-{timestamp}.json",
+    ]
@@ -249,3 +249,29 @@ def test_forbid_value_and_auth():
     filter_set = filters.FilterSet()
     with pytest.raises(IncorrectUsage, match=filters.ERROR_EXPECTED_AND_REGEX):
         filter_set.include(method="POST", method_regex="GET")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"tag": ["a", "b"]},
+        {"operation_id": ["a", "b"]},
+    ],
+)
+def test_unhashable_raw_values(kwargs):
+    # Malformed schemas may contain non-string tags & operation ids - they should not match
+    raw = {
+        "openapi": "3.0.2",
+        "info": {"title": "Test", "description": "Test", "version": "0.1.0"},
+        "paths": {
+            "/users/": {
+                "get": {
+                    "responses": {"200": {"description": "OK"}},
+                    "tags": [{"name": "a"}],
+                    "operationId": {"name": "a"},
+                },
+            },
+        },
+    }
+    schema = schemathesis.openapi.from_dict(raw).include(**kwargs)
+    assert list(schema.get_all_operations()) == []